@@ -0,0 +1,362 @@
+"""Núcleo compartido de Control de Gastos.
+
+Modelo de datos, persistencia y cálculos de resumen usados tanto por la
+interfaz de consola (control_gastos.py) como por la Tk (control_gastos_app.py):
+una sola implementación, una sola vez cada optimización.
+"""
+from __future__ import annotations
+
+import json
+import os
+from bisect import bisect_left
+from dataclasses import dataclass
+from datetime import date, timedelta
+from decimal import Decimal, InvalidOperation, ROUND_HALF_UP
+from functools import lru_cache
+from typing import Dict, List, Tuple
+
+try:
+    import orjson  # serialización mucho más rápida; opcional
+except ImportError:
+    orjson = None
+
+try:
+    import numpy as np  # vectoriza la suma de historiales grandes; opcional
+except ImportError:
+    np = None
+
+try:
+    import ijson  # parseo incremental de archivos grandes; opcional
+except ImportError:
+    ijson = None
+
+# por debajo de esto el loop de Python es más rápido que armar el array
+_NP_MIN_ROWS = 512
+
+# a partir de este tamaño de archivo conviene el parseo incremental
+_STREAM_MIN_BYTES = 1 << 20
+
+
+DATA_DIR = "data"
+DATA_FILE = os.path.join(DATA_DIR, "control_gastos.json")
+
+
+# ----------------------------
+# Helpers de dinero / fechas
+# ----------------------------
+def _to_cents_slow(s: str) -> int:
+    # camino lento (notación científica, etc.): Decimal + quantize
+    try:
+        dec = Decimal(s)
+    except InvalidOperation:
+        raise ValueError("Número inválido.")
+    return int(dec.quantize(Decimal("0.01"), rounding=ROUND_HALF_UP).scaleb(2))
+
+
+def to_cents(value: str | int | float | Decimal) -> int:
+    """Convierte un monto a centavos enteros (la aritmética interna usa int).
+
+    Camino rápido para el caso común "123" / "123.45" sin pasar por
+    Decimal.quantize; redondea half-up en el tercer decimal.
+    """
+    s = str(value).strip().replace(",", ".")
+    body = s[1:] if s[:1] in ("-", "+") else s
+    whole, _, frac = body.partition(".")
+    if (whole.isdigit() or (not whole and frac)) and (not frac or frac.isdigit()):
+        cents = int(whole or 0) * 100 + int((frac + "00")[:2])
+        if len(frac) > 2 and frac[2] >= "5":
+            cents += 1
+        return -cents if s[:1] == "-" else cents
+    return _to_cents_slow(s)
+
+
+def from_cents(cents: int) -> Decimal:
+    """Centavos enteros -> Decimal con 2 decimales (sólo para mostrar/serializar)."""
+    return Decimal(cents).scaleb(-2)
+
+
+def d(value: str | int | float | Decimal) -> Decimal:
+    """Convierte a Decimal con 2 decimales."""
+    return from_cents(to_cents(value))
+
+
+def parse_date(s: str) -> date:
+    """Acepta YYYY-MM-DD. Sólo valida entrada del usuario: internamente las
+    fechas ISO se comparan/agrupan como strings (el orden lexicográfico
+    coincide con el cronológico), así que nunca se re-parsean filas."""
+    s = s.strip()
+    if (
+        len(s) != 10
+        or s[4] != "-"
+        or s[7] != "-"
+        or not (s[:4].isdigit() and s[5:7].isdigit() and s[8:10].isdigit())
+    ):
+        raise ValueError("Fecha inválida. Usá el formato YYYY-MM-DD (ej: 2026-01-03).")
+    try:
+        return date(int(s[:4]), int(s[5:7]), int(s[8:10]))
+    except ValueError:
+        raise ValueError("Fecha inválida. Usá el formato YYYY-MM-DD (ej: 2026-01-03).")
+
+
+def month_start(dt: date) -> date:
+    return dt.replace(day=1)
+
+
+def month_end(dt: date) -> date:
+    # primer día del mes siguiente - 1 día
+    if dt.month == 12:
+        first_next = dt.replace(year=dt.year + 1, month=1, day=1)
+    else:
+        first_next = dt.replace(month=dt.month + 1, day=1)
+    return first_next - timedelta(days=1)
+
+
+@lru_cache(maxsize=64)
+def month_bounds(dt: date) -> Tuple[date, date, str]:
+    """(primer día, último día, YYYY-MM) del mes de 'dt'.
+
+    Sólo cambia a medianoche: memoizado para que refrescar el resumen no
+    repita replace/timedelta/strftime."""
+    return month_start(dt), month_end(dt), dt.strftime("%Y-%m")
+
+
+@lru_cache(maxsize=64)
+def days_remaining_in_month(today: date) -> int:
+    end = month_bounds(today)[1]
+    # incluye hoy como "día por gastar"
+    return (end - today).days + 1
+
+
+def fmt_money_cents(cents: int) -> str:
+    """Formatea centavos enteros directamente: evita el camino lento del
+    formateo de Decimal cuando se renderizan muchas filas."""
+    neg = cents < 0
+    if neg:
+        cents = -cents
+    whole, frac = divmod(cents, 100)
+    return f"{'-' if neg else ''}${whole:,}.{frac:02d}"
+
+
+def fmt_money(x: Decimal) -> str:
+    # Formato simple estilo AR: 1234.50 (si querés, lo adaptamos a 1.234,50)
+    return fmt_money_cents(to_cents(x))
+
+
+# Cache del monto ya convertido a centavos por fila: evita repetir
+# Decimal.quantize en cada refresco del resumen y suma con int puro.
+_amount_cache: Dict[int, int] = {}
+
+
+def _row_cents(row: Dict) -> int:
+    cached = _amount_cache.get(id(row))
+    if cached is None:
+        cached = _amount_cache.setdefault(id(row), to_cents(row["amount"]))
+    return cached
+
+
+# ----------------------------
+# Modelo de datos
+# ----------------------------
+# Las dataclasses documentan la forma de cada fila; los caminos calientes de
+# inserción arman el dict directamente (asdict recorre campos y deep-copia).
+@dataclass
+class Expense:
+    amount: str  # guardamos como string para JSON; convertimos a Decimal al operar
+    category: str
+    dt: str      # YYYY-MM-DD
+    note: str = ""
+
+
+@dataclass
+class Income:
+    person: str
+    amount: str  # mensual base
+    month: str   # YYYY-MM (ej: 2026-01)
+
+
+@dataclass
+class ExtraIncome:
+    person: str
+    amount: str
+    dt: str      # YYYY-MM-DD
+    note: str = ""
+
+
+def default_state() -> Dict:
+    return {
+        "categories": [],
+        "people": [],
+        "monthly_incomes": [],  # lista de Income
+        "extra_incomes": [],    # lista de ExtraIncome
+        "expenses": [],         # lista de Expense
+    }
+
+
+def build_month_index(state: Dict) -> Dict:
+    """Índice por mes (YYYY-MM) para no recorrer el historial completo.
+
+    Agrupa por row["dt"][:7] directamente sobre el string ISO, sin parsear."""
+    index: Dict[str, Dict[str, List[Dict]]] = {"monthly_incomes": {}, "extra_incomes": {}, "expenses": {}}
+    for row in state["monthly_incomes"]:
+        index["monthly_incomes"].setdefault(row["month"], []).append(row)
+    for key in ("extra_incomes", "expenses"):
+        for row in state[key]:
+            index[key].setdefault(row["dt"][:7], []).append(row)
+    return index
+
+
+def _sum_cents(rows: List[Dict]) -> int:
+    """Suma los montos de 'rows' en centavos; vectorizado con NumPy si hay
+    suficientes filas (los montos guardados siempre tienen <= 2 decimales,
+    así que el redondeo vía float es exacto)."""
+    if np is not None and len(rows) >= _NP_MIN_ROWS:
+        amounts = np.array([row["amount"] for row in rows], dtype=np.float64)
+        return int(np.rint(amounts * 100).sum())
+    total = 0
+    for row in rows:
+        total += _row_cents(row)
+    return total
+
+
+def build_month_totals(index: Dict) -> Dict[str, List[int]]:
+    """Totales acumulados [base, extra, gastos] en centavos por mes."""
+    totals: Dict[str, List[int]] = {}
+    for key, slot in (("monthly_incomes", 0), ("extra_incomes", 1), ("expenses", 2)):
+        for month_key, rows in index[key].items():
+            totals.setdefault(month_key, [0, 0, 0])[slot] += _sum_cents(rows)
+    return totals
+
+
+def _load_streaming() -> Dict:
+    """Parsea el archivo incrementalmente con ijson: lee por chunks en vez de
+    materializar todo el blob de bytes de una vez (historiales multi-año)."""
+    state = default_state()
+    with open(DATA_FILE, "rb") as f:
+        for key, value in ijson.kvitems(f, ""):
+            state[key] = value
+    return state
+
+
+def load_state() -> Tuple[Dict, Dict]:
+    os.makedirs(DATA_DIR, exist_ok=True)
+    _amount_cache.clear()
+    if not os.path.exists(DATA_FILE):
+        state = default_state()
+        save_state(state)
+    elif ijson is not None and os.path.getsize(DATA_FILE) >= _STREAM_MIN_BYTES:
+        state = _load_streaming()
+    else:
+        with open(DATA_FILE, "rb") as f:
+            raw = f.read()
+        state = orjson.loads(raw) if orjson is not None else json.loads(raw)
+    index = build_month_index(state)
+    state["_totals"] = build_month_totals(index)
+    return state, index
+
+
+def save_state(state: Dict) -> None:
+    os.makedirs(DATA_DIR, exist_ok=True)
+    # las claves "_*" son derivadas en memoria; no se serializan
+    persistable = {k: v for k, v in state.items() if not k.startswith("_")}
+    # escritura atómica: tmp + os.replace evita archivos a medio escribir
+    tmp = DATA_FILE + ".tmp"
+    if orjson is not None:
+        with open(tmp, "wb") as f:
+            f.write(orjson.dumps(persistable, option=orjson.OPT_INDENT_2))
+    else:
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(persistable, f, ensure_ascii=False, indent=2)
+    os.replace(tmp, DATA_FILE)
+
+
+# ----------------------------
+# Operaciones
+# ----------------------------
+# Espejo en minúsculas por lista (categorías/personas), ordenado en lockstep:
+# permite insertar con bisect sin re-sortear y buscar duplicados en O(log N).
+_lower_mirrors: Dict[int, List[str]] = {}
+
+
+def _lower_mirror(lst: List[str]) -> List[str]:
+    mirror = _lower_mirrors.get(id(lst))
+    if mirror is None or len(mirror) != len(lst):
+        mirror = [x.lower() for x in lst]
+        if any(mirror[i] > mirror[i + 1] for i in range(len(mirror) - 1)):
+            # lista editada a mano fuera de orden: normalizamos una sola vez
+            lst.sort(key=str.lower)
+            mirror = [x.lower() for x in lst]
+        _lower_mirrors[id(lst)] = mirror
+    return mirror
+
+
+def ensure_unique_add(lst: List[str], item: str) -> bool:
+    item = item.strip()
+    if not item:
+        return False
+    mirror = _lower_mirror(lst)
+    key = item.lower()
+    i = bisect_left(mirror, key)
+    j = i
+    while j < len(mirror) and mirror[j] == key:
+        if lst[j] == item:
+            return False
+        j += 1
+    # insertar al final del tramo de claves iguales = mismo orden que el
+    # sort estable anterior
+    mirror.insert(j, key)
+    lst.insert(j, item)
+    return True
+
+
+def set_monthly_income(state: Dict, index: Dict, person: str, amount: Decimal, month_key: str) -> None:
+    # si ya existe, lo reemplaza
+    incomes = state["monthly_incomes"]
+    for row in incomes:
+        if row["person"] == person and row["month"] == month_key:
+            old_cents = _row_cents(row)
+            row["amount"] = str(amount)
+            _amount_cache.pop(id(row), None)
+            state["_totals"].setdefault(month_key, [0, 0, 0])[0] += to_cents(amount) - old_cents
+            return
+    row = {"person": person, "amount": str(amount), "month": month_key}
+    incomes.append(row)
+    index["monthly_incomes"].setdefault(month_key, []).append(row)
+    state["_totals"].setdefault(month_key, [0, 0, 0])[0] += to_cents(amount)
+
+
+def add_extra_income(state: Dict, index: Dict, person: str, amount: Decimal, dt: date, note: str = "") -> None:
+    row = {"person": person, "amount": str(amount), "dt": dt.isoformat(), "note": note.strip()}
+    state["extra_incomes"].append(row)
+    month_key = dt.isoformat()[:7]
+    index["extra_incomes"].setdefault(month_key, []).append(row)
+    state["_totals"].setdefault(month_key, [0, 0, 0])[1] += to_cents(amount)
+
+
+def add_expense(state: Dict, index: Dict, amount: Decimal, category: str, dt: date, note: str = "") -> None:
+    row = {"amount": str(amount), "category": category, "dt": dt.isoformat(), "note": note.strip()}
+    state["expenses"].append(row)
+    month_key = dt.isoformat()[:7]
+    index["expenses"].setdefault(month_key, []).append(row)
+    state["_totals"].setdefault(month_key, [0, 0, 0])[2] += to_cents(amount)
+
+
+def totals_cents(state: Dict, month_key: str) -> Tuple[int, int, int]:
+    """(base, extra, gastos) del mes en centavos enteros: lookup O(1)."""
+    bucket = state["_totals"].get(month_key)
+    if bucket is None:
+        return 0, 0, 0
+    return bucket[0], bucket[1], bucket[2]
+
+
+def totals_for_month(state: Dict, today: date) -> Tuple[Decimal, Decimal, Decimal]:
+    """(ingresos_base, ingresos_extra, gastos) para el mes de 'today'."""
+    base_income, extra_income, expenses = totals_cents(state, month_bounds(today)[2])
+    return from_cents(base_income), from_cents(extra_income), from_cents(expenses)
+
+
+def remaining_and_per_day(state: Dict, today: date) -> Tuple[Decimal, Decimal, int]:
+    base_income, extra_income, expenses = totals_cents(state, month_bounds(today)[2])
+    remaining_cents = base_income + extra_income - expenses
+    days_left = days_remaining_in_month(today)
+    per_day_cents, _ = divmod(remaining_cents, days_left) if days_left > 0 else (0, 0)
+    return from_cents(remaining_cents), from_cents(per_day_cents), days_left